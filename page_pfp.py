@@ -1,42 +1,99 @@
 """PAGE PFP - Event-driven, well-typed version.
 
 Requirements:
-    pip install watchdog keyboard pyperclip win10toast rich
+    pip install watchdog keyboard pyperclip rich
 """
 
 from __future__ import annotations
 
+import ctypes
 import os
-import queue
+import struct
+import sys
 import threading
 import time
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Final, Optional, List, Set
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Final,
+    FrozenSet,
+    Optional,
+    List,
+    Set,
+    Union,
+)
 
 import pyperclip
-import keyboard  # type: ignore
 from watchdog.events import FileSystemEventHandler  # type: ignore
-from watchdog.observers import Observer  # type: ignore
 from rich.console import Console
-from win10toast import ToastNotifier  # type: ignore
+from rich.text import Text
 import re
-import tkinter as tk
-from tkinter import filedialog, messagebox
+
+# keyboard, tkinter and the watchdog observer are imported where they're first needed
+if TYPE_CHECKING:
+    from watchdog.observers import Observer  # type: ignore
 
 # ---------- typing aliases ----------
-DownloadQueue = queue.Queue["DownloadEvent"]
+# appended by the watcher thread, drained by the main flow; append/popleft are
+# atomic, and a companion threading.Event signals that items are available
+DownloadQueue = Deque["DownloadEvent"]
 
 # ---------- constants ----------
 DEFAULT_DOWNLOADS: Final[Path] = Path.home() / "Downloads"
-
-# ---------- console & toaster ----------
+# upper bound for a single blocking wait; untimed lock waits can't be
+# interrupted by Ctrl+C on Windows, so waiters re-arm at this interval
+_WAIT_SLICE: Final[float] = 1.0
+# a read-write open fails with a sharing violation on Windows while the browser
+# still holds its write handle, which a plain read-only open would not detect
+_READY_PROBE_FLAGS: Final[int] = (
+    os.O_RDWR | os.O_BINARY if sys.platform == "win32" else os.O_RDONLY
+)
+# Ctrl+V can fire several hotkey callbacks for one press
+_PASTE_DEBOUNCE: Final[float] = 0.02
+# bumped by Windows on every clipboard change; lets Ctrl+V reuse the last read
+_get_clipboard_seq: Optional[Callable[[], int]] = (
+    ctypes.windll.user32.GetClipboardSequenceNumber  # type: ignore
+    if sys.platform == "win32"
+    else None
+)
+# short random names browsers give to downloads before the final rename
+_RANDOM_PNG_RE: Final[re.Pattern[str]] = re.compile(r"^[A-Za-z0-9]{6,12}\.png$")
+
+# ---------- console ----------
 console: Console = Console()
 print = console.print
 
+# static messages pre-built as Text so Rich doesn't re-parse markup per print
+_CLIPBOARD_MISMATCH_MSG: Final[Text] = Text(
+    "Conteúdo do clipboard não corresponde ao esperado.", style="yellow"
+)
+_WAITING_PASTE_MSG: Final[Text] = Text(
+    "\nAguardando o conteúdo ser colado (Ctrl+V) ou Ctrl+R para pular.\n"
+)
+_WAITING_DOWNLOAD_MSG: Final[Text] = Text(
+    "Aguardando arquivo ser baixado (pressione Ctrl+Shift+C para continuar sem download)\n"
+)
+_PROMPT_SKIPPED_MSG: Final[Text] = Text("Prompt pulado pelo usuário.", style="yellow")
+_NO_NEW_FILE_MSG: Final[Text] = Text(
+    "Nenhum arquivo novo encontrado. Pulando renomeação.", style="yellow"
+)
+_PATH_SKIPPED_MSG: Final[Text] = Text("Caminho pulado pelo usuário.", style="yellow")
+_FINISHED_MSG: Final[Text] = Text("\nProcesso finalizado.", style="green")
+
 console.clear()
 
 
+# ---------- helpers ----------
+def _is_png(name: str) -> bool:
+    """Case-insensitive ``.png`` suffix check that doesn't lowercase the whole name."""
+    return len(name) >= 4 and name[-4] == "." and name[-3:].lower() == "png"
+
+
 @dataclass(frozen=True)
 class DownloadEvent:
     """Represents a file creation event in the Downloads folder."""
@@ -45,24 +102,199 @@ class DownloadEvent:
     path: Path
 
 
+# posted by the skip hotkey so a blocked downloads waiter wakes up immediately
+_SKIP_SENTINEL: Final[DownloadEvent] = DownloadEvent(filename="", path=Path())
+
+
 class DownloadsHandler(FileSystemEventHandler):
-    """Watchdog handler that pushes file creation events into a queue."""
+    """Watchdog handler that pushes .png creation/modification events into a queue.
+
+    A download produces one CREATE and several MODIFY events; events for the
+    same name within ``_COALESCE_WINDOW`` seconds are collapsed into one.
+    """
+
+    _COALESCE_WINDOW: Final[float] = 0.5
+    _PRUNE_AFTER: Final[float] = 5.0
 
-    def __init__(self, downloads_q: DownloadQueue) -> None:
+    def __init__(
+        self, downloads_q: DownloadQueue, downloads_avail: threading.Event
+    ) -> None:
         super().__init__()
         self._q: DownloadQueue = downloads_q
+        self._avail: threading.Event = downloads_avail
+        self._recent: Dict[str, float] = {}
+        self._last_prune: float = 0.0
 
     def on_created(
         self, event  # type: ignore
     ) -> None:  # watchdog Event has a complex type; keep it simple
-        if event.is_directory:
+        if not event.is_directory:
+            self.push(event.src_path)  # type: ignore
+
+    def on_modified(self, event) -> None:  # type: ignore
+        if not event.is_directory:
+            self.push(event.src_path)  # type: ignore
+
+    def push(self, src_path: str) -> None:
+        """Queue a download event for ``src_path`` unless it is filtered or coalesced."""
+        if not _is_png(src_path):
             return
-        created = Path(event.src_path)  # type: ignore
+        now = time.monotonic()
+        if now - self._last_prune > self._PRUNE_AFTER:
+            self._recent = {
+                k: ts for k, ts in self._recent.items() if now - ts < self._PRUNE_AFTER
+            }
+            self._last_prune = now
+        last = self._recent.get(src_path)
+        if last is not None and now - last < self._COALESCE_WINDOW:
+            return
+        self._recent[src_path] = now
+        created = Path(src_path)
+        self._q.append(DownloadEvent(filename=created.name, path=created))
+        self._avail.set()
+
+
+class WindowsDirectoryWatcher(threading.Thread):
+    """Watch a directory with ``ReadDirectoryChangesW`` and feed a DownloadsHandler.
+
+    Unlike watchdog's observer, which subscribes to attribute, size, access and
+    security changes as well, only file-name and last-write changes are
+    requested, so unrelated activity in the folder doesn't wake this thread.
+    """
+
+    _FILE_LIST_DIRECTORY: Final[int] = 0x0001
+    _FILE_SHARE_READ_WRITE_DELETE: Final[int] = 0x0001 | 0x0002 | 0x0004
+    _OPEN_EXISTING: Final[int] = 3
+    _FILE_FLAG_BACKUP_SEMANTICS: Final[int] = 0x02000000
+    # FILE_NOTIFY_CHANGE_FILE_NAME | FILE_NOTIFY_CHANGE_LAST_WRITE
+    _NOTIFY_FILTER: Final[int] = 0x0001 | 0x0010
+    _BUFFER_SIZE: Final[int] = 64 * 1024
+    _ERROR_OPERATION_ABORTED: Final[int] = 995
+    # FILE_ACTION_ADDED, FILE_ACTION_MODIFIED, FILE_ACTION_RENAMED_NEW_NAME
+    _FORWARDED_ACTIONS: Final[FrozenSet[int]] = frozenset((1, 3, 5))
+
+    def __init__(self, directory: Path, handler: DownloadsHandler) -> None:
+        super().__init__(name="downloads-watcher", daemon=True)
+        from ctypes import wintypes
+
+        kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)  # type: ignore
+        kernel32.CreateFileW.restype = wintypes.HANDLE
+        kernel32.CreateFileW.argtypes = (
+            wintypes.LPCWSTR,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.LPVOID,
+            wintypes.DWORD,
+            wintypes.DWORD,
+            wintypes.HANDLE,
+        )
+        kernel32.ReadDirectoryChangesW.restype = wintypes.BOOL
+        kernel32.ReadDirectoryChangesW.argtypes = (
+            wintypes.HANDLE,
+            wintypes.LPVOID,
+            wintypes.DWORD,
+            wintypes.BOOL,
+            wintypes.DWORD,
+            ctypes.POINTER(wintypes.DWORD),
+            wintypes.LPVOID,
+            wintypes.LPVOID,
+        )
+        kernel32.CancelIoEx.restype = wintypes.BOOL
+        kernel32.CancelIoEx.argtypes = (wintypes.HANDLE, wintypes.LPVOID)
+        kernel32.CloseHandle.restype = wintypes.BOOL
+        kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+        self._kernel32 = kernel32
+        self._dword = wintypes.DWORD
+
+        self._directory: str = str(directory)
+        self._handler: DownloadsHandler = handler
+        self._stopping: bool = False
+        # guards the handle between run()'s close and stop()'s cancel
+        self._handle_lock: threading.Lock = threading.Lock()
+        handle = kernel32.CreateFileW(
+            self._directory,
+            self._FILE_LIST_DIRECTORY,
+            self._FILE_SHARE_READ_WRITE_DELETE,
+            None,
+            self._OPEN_EXISTING,
+            self._FILE_FLAG_BACKUP_SEMANTICS,
+            None,
+        )
+        if handle is None or handle == wintypes.HANDLE(-1).value:
+            raise ctypes.WinError(ctypes.get_last_error())  # type: ignore
+        self._handle: Optional[int] = handle
+
+    def run(self) -> None:
+        buffer = ctypes.create_string_buffer(self._BUFFER_SIZE)
+        returned = self._dword()
+        try:
+            while not self._stopping:
+                ok = self._kernel32.ReadDirectoryChangesW(
+                    self._handle,
+                    buffer,
+                    self._BUFFER_SIZE,
+                    False,
+                    self._NOTIFY_FILTER,
+                    ctypes.byref(returned),
+                    None,
+                    None,
+                )
+                if not ok:
+                    error = ctypes.get_last_error()  # type: ignore
+                    if not self._stopping and error != self._ERROR_OPERATION_ABORTED:
+                        # folder removed, unsupported share, ...: nothing more will arrive
+                        console.print(
+                            f"[red]Falha ao observar {self._directory}: "
+                            f"{ctypes.FormatError(error)}. "  # type: ignore
+                            "Pressione Ctrl+Shift+C para continuar sem download.[/red]"
+                        )
+                    break
+                if returned.value:
+                    self._dispatch(buffer.raw[: returned.value])
+                else:
+                    # 0 bytes means the buffer overflowed and events were lost
+                    self._rescan()
+        finally:
+            with self._handle_lock:
+                handle, self._handle = self._handle, None
+                if handle is not None:
+                    self._kernel32.CloseHandle(handle)
+
+    def _dispatch(self, data: bytes) -> None:
+        """Decode FILE_NOTIFY_INFORMATION records and forward the relevant ones."""
+        offset = 0
+        while True:
+            next_offset, action, name_len = struct.unpack_from("<III", data, offset)
+            if action in self._FORWARDED_ACTIONS:
+                start = offset + 12
+                name = data[start : start + name_len].decode("utf-16-le")
+                self._handler.push(os.path.join(self._directory, name))
+            if next_offset == 0:
+                return
+            offset += next_offset
+
+    def _rescan(self) -> None:
+        """Re-announce every file in the directory after events were lost."""
         try:
-            self._q.put_nowait(DownloadEvent(filename=created.name, path=created))
-        except queue.Full:
-            # queue is bounded? default is infinite; keep safe guard
-            console.print("[yellow]Downloads queue full — event dropped[/yellow]")
+            with os.scandir(self._directory) as it:
+                for entry in it:
+                    if entry.is_file():
+                        self._handler.push(entry.path)
+        except OSError as exc:
+            console.print(f"[red]Falha ao reler {self._directory}: {exc}[/red]")
+
+    def stop(self) -> None:
+        """Cancel the pending read and wait until run() has returned.
+
+        A read issued just after run() checked the stop flag has nothing to
+        cancel yet, so the cancel is repeated until the thread exits.
+        """
+        self._stopping = True
+        while self.is_alive():
+            with self._handle_lock:
+                if self._handle is not None:
+                    self._kernel32.CancelIoEx(self._handle, None)
+            self.join(0.1)
 
 
 class PagePFP:
@@ -78,54 +310,99 @@ class PagePFP:
         self.images_dir: Path = images_dir
         self.names_file: Path = names_file
 
-        self._downloads_q: DownloadQueue = queue.Queue()
-        self._observer: Optional[Observer] = None  # type: ignore
+        self._downloads_q: DownloadQueue = deque()
+        self._downloads_avail: threading.Event = threading.Event()
+        self._observer: Optional[Union[Observer, WindowsDirectoryWatcher]] = None  # type: ignore
 
-        # synchronization events
-        self._paste_event: threading.Event = threading.Event()
-        self._skip_prompt_event: threading.Event = threading.Event()
-        self._skip_wait_download_event: threading.Event = threading.Event()
+        # hotkey flags: each is written by the hotkey thread and read by one
+        # waiter, and published by the wake event / downloads deque that follows
+        self._paste_flag: bool = False
+        self._skip_prompt_flag: bool = False
+        self._skip_wait_download_flag: bool = False
         self._expected_clipboard_text: Optional[str] = None
-
-        self._toaster: ToastNotifier = ToastNotifier()
+        self._last_paste_check_ts: float = 0.0
+        self._last_clip_seq: int = 0
+        self._last_clip_text: str = ""
+        # set after the paste/skip flags so the prompt waiter can block on it
+        self._wake_event: threading.Event = threading.Event()
 
         self._register_hotkeys()
 
     # ---- hotkeys ----
     def _register_hotkeys(self) -> None:
         """Register application-level hotkeys (global)."""
+        import keyboard  # type: ignore
+
         keyboard.add_hotkey("ctrl+v", self._on_paste_hotkey)
         keyboard.add_hotkey("ctrl+r", self._on_skip_prompt_hotkey)
         keyboard.add_hotkey("ctrl+shift+c", self._on_skip_wait_download_hotkey)
 
     def _on_paste_hotkey(self) -> None:
         """Handler for Ctrl+V: verify clipboard equals expected string and set paste event."""
-        current: str = pyperclip.paste()
-        if self._expected_clipboard_text is None:
+        expected = self._expected_clipboard_text
+        if expected is None:
+            return
+        now = time.monotonic()
+        if now - self._last_paste_check_ts < _PASTE_DEBOUNCE:
             return
-        if current == self._expected_clipboard_text:
-            self._paste_event.set()
+        self._last_paste_check_ts = now
+        current: str = self._read_clipboard()
+        if current == expected:
+            self._paste_flag = True
+            self._wake_event.set()
         else:
-            console.print(
-                "[yellow]Conteúdo do clipboard não corresponde ao esperado.[/yellow]"
-            )
+            console.print(_CLIPBOARD_MISMATCH_MSG)
+
+    def _read_clipboard(self) -> str:
+        """Return clipboard text, reusing the last read while the clipboard is unchanged."""
+        if _get_clipboard_seq is None:
+            return pyperclip.paste()
+        seq = _get_clipboard_seq()
+        # 0 means the sequence number is unavailable to this process
+        if seq == 0 or seq != self._last_clip_seq:
+            self._last_clip_text = pyperclip.paste()
+            self._last_clip_seq = seq
+        return self._last_clip_text
+
+    def _set_clipboard(self, text: str) -> None:
+        """Copy text to the clipboard, skipping the write when it already holds it."""
+        if _get_clipboard_seq is None:
+            pyperclip.copy(text)
+            return
+        seq = _get_clipboard_seq()
+        if seq != 0 and seq == self._last_clip_seq and text == self._last_clip_text:
+            return
+        pyperclip.copy(text)
+        # our own write is the latest clipboard content; later reads can reuse it
+        self._last_clip_text = text
+        self._last_clip_seq = _get_clipboard_seq()
 
     def _on_skip_prompt_hotkey(self) -> None:
         """Handler for Ctrl+R: skip the current prompt step."""
-        self._skip_prompt_event.set()
+        self._skip_prompt_flag = True
+        self._wake_event.set()
 
     def _on_skip_wait_download_hotkey(self) -> None:
         """Handler for Ctrl+Shift+C: skip waiting for download."""
-        self._skip_wait_download_event.set()
+        self._skip_wait_download_flag = True
+        self._downloads_q.append(_SKIP_SENTINEL)
+        self._downloads_avail.set()
 
     # ---- watcher ----
     def start_downloads_watcher(self) -> None:
-        """Start the watchdog observer for the downloads folder."""
-        handler = DownloadsHandler(self._downloads_q)
-        observer = Observer()
-        observer.schedule(handler, str(self.downloads_dir), recursive=False)
-        observer.start()
-        self._observer = observer
+        """Start watching the downloads folder (native watcher on Windows, watchdog elsewhere)."""
+        handler = DownloadsHandler(self._downloads_q, self._downloads_avail)
+        if sys.platform == "win32":
+            watcher = WindowsDirectoryWatcher(self.downloads_dir, handler)
+            watcher.start()
+            self._observer = watcher
+        else:
+            from watchdog.observers import Observer  # type: ignore
+
+            observer = Observer()
+            observer.schedule(handler, str(self.downloads_dir), recursive=False)
+            observer.start()
+            self._observer = observer
         console.print(
             f"[dim]Observando {self.downloads_dir} por novos arquivos...[/dim]"
         )
@@ -138,12 +415,27 @@ class PagePFP:
             self._observer = None
 
     # ---- IO and helpers ----
+    def _snapshot_downloads(self) -> Set[str]:
+        """Return the names of the .png files currently in the downloads folder.
+        Only .png names are ever looked up in the snapshot, so others aren't kept."""
+        with os.scandir(self.downloads_dir) as it:
+            return {entry.name for entry in it if _is_png(entry.name)}
+
+    def _index_images(self) -> Dict[str, str]:
+        """Map the normcased stem of every .png in images_dir to its path string."""
+        index: Dict[str, str] = {}
+        with os.scandir(self.images_dir) as it:
+            for entry in it:
+                if _is_png(entry.name):
+                    index[os.path.normcase(entry.name[:-4])] = entry.path
+        return index
+
     def read_names(self) -> List[str]:
         """Read names file and return non-empty, stripped lines."""
         if not self.names_file.exists():
             raise FileNotFoundError(f"{self.names_file} não encontrado.")
         content: str = self.names_file.read_text(encoding="utf-8")
-        names: List[str] = [n.strip() for n in re.split(r"\n+", content) if n.strip()]
+        names: List[str] = [s for s in (ln.strip() for ln in content.splitlines()) if s]
         return names
 
     def _wait_for_user_paste_or_skip(
@@ -152,62 +444,84 @@ class PagePFP:
         """Wait until user pastes the expected text (Ctrl+V) or presses skip (Ctrl+R).
         Returns True when the paste was confirmed, False when skipped or timed out."""
         self._expected_clipboard_text = expected_text
-        self._paste_event.clear()
-        self._skip_prompt_event.clear()
+        self._paste_flag = False
+        self._skip_prompt_flag = False
+        self._wake_event.clear()
 
-        console.print(
-            "\nAguardando o conteúdo ser colado (Ctrl+V) ou Ctrl+R para pular.\n"
-        )
+        console.print(_WAITING_PASTE_MSG)
 
-        start = time.time()
+        wake = self._wake_event
+        now = time.monotonic
+        start = now()
         while True:
-            if self._paste_event.is_set():
+            if self._paste_flag:
                 self._expected_clipboard_text = None
                 return True
-            if self._skip_prompt_event.is_set():
-                self._expected_clipboard_text = None
-                return False
-            if timeout is not None and (time.time() - start) > timeout:
+            if self._skip_prompt_flag:
                 self._expected_clipboard_text = None
                 return False
-            time.sleep(0.05)
+            remaining = _WAIT_SLICE
+            if timeout is not None:
+                remaining = min(remaining, timeout - (now() - start))
+                if remaining <= 0:
+                    self._expected_clipboard_text = None
+                    return False
+            # handlers set their flag before the wake event, so clearing
+            # after wake-up never loses a signal
+            if wake.wait(remaining):
+                wake.clear()
 
     def _wait_for_new_png_download(
         self, original_snapshot: Set[str], timeout: Optional[float] = None
     ) -> Optional[Path]:
         """Wait for a new .png file event that is not in the original snapshot.
         Returns Path to the new file or None if skipped/timed out."""
-        self._skip_wait_download_event.clear()
-        start = time.time()
+        self._skip_wait_download_flag = False
+        # bound once: a download can push many MODIFY events through this loop
+        pending = self._downloads_q
+        pop = pending.popleft
+        avail = self._downloads_avail
+        in_snapshot = original_snapshot.__contains__
+        random_match = _RANDOM_PNG_RE.match
+        now = time.monotonic
+        start = now()
 
         while True:
-            if self._skip_wait_download_event.is_set():
-                return None
-            try:
-                evt: DownloadEvent = self._downloads_q.get(timeout=0.1)
-            except queue.Empty:
-                if timeout is not None and (time.time() - start) > timeout:
-                    return None
+            if not pending:
+                remaining = _WAIT_SLICE
+                if timeout is not None:
+                    remaining = min(remaining, timeout - (now() - start))
+                    if remaining <= 0:
+                        return None
+                # cleared before re-checking the deque, so an append racing
+                # with this wake-up is either seen now or sets the event again
+                if avail.wait(remaining):
+                    avail.clear()
                 continue
 
-            if not evt.filename.lower().endswith(".png"):
+            evt: DownloadEvent = pop()
+
+            if evt is _SKIP_SENTINEL:
+                # sentinels left over from a press outside this wait are stale
+                if self._skip_wait_download_flag:
+                    return None
                 continue
 
-            if evt.filename in original_snapshot:
+            # only .png events get this far: DownloadsHandler.push filters the rest
+            filename = evt.filename
+            if in_snapshot(filename):
                 continue
 
             full_path: Path = evt.path
 
             # skip suspicious short or random-looking filenames (likely temporary)
-            if len(evt.filename) < 8 or re.match(
-                r"^[A-Za-z0-9]{6,12}\.png$", evt.filename
-            ):
+            # the random-name pattern only matches 10..16 chars; skip the regex otherwise
+            name_len = len(filename)
+            if name_len < 8 or (10 <= name_len <= 16 and random_match(filename)):
                 time.sleep(1.0)  # wait a bit; browser might rename it soon
                 possible_new = list(evt.path.parent.glob("*.png"))
                 # pick the newest file that isn't in snapshot
-                candidates = [
-                    p for p in possible_new if p.name not in original_snapshot
-                ]
+                candidates = [p for p in possible_new if not in_snapshot(p.name)]
                 if candidates:
                     latest = max(candidates, key=lambda p: p.stat().st_mtime)
                     if self._wait_until_file_is_ready(latest, max_wait=5.0):
@@ -219,119 +533,165 @@ class PagePFP:
 
     @staticmethod
     def _wait_until_file_is_ready(path: Path, max_wait: float = 5.0) -> bool:
-        """Try opening file to ensure it's finished writing."""
-        start = time.time()
+        """Try opening file to ensure it's finished writing.
+        Backs off from immediate retries to yielding, short and then long sleeps."""
+        now = time.monotonic
+        start = now()
+        attempts = 0
         while True:
             try:
                 if not path.exists():
                     return False
-                with open(path, "rb"):
-                    return True
+                os.close(os.open(path, _READY_PROBE_FLAGS))
+                return True
             except (PermissionError, OSError):
-                if (time.time() - start) > max_wait:
+                if (now() - start) > max_wait:
                     return False
-                time.sleep(0.1)
-
-    def move_and_rename_file(self, downloaded_path: Path, target_name: str) -> bool:
-        """Move downloaded file into images_dir with a safe name (appends counter if needed)."""
+                attempts += 1
+                if attempts < 3:
+                    continue
+                if attempts < 10:
+                    time.sleep(0)
+                elif attempts < 30:
+                    time.sleep(0.01)
+                else:
+                    time.sleep(0.1)
+
+    def move_and_rename_file(
+        self, downloaded_path: Path, target_name: str
+    ) -> Optional[Path]:
+        """Move downloaded file into images_dir with a safe name (appends counter if needed).
+        Returns the destination path, or None when the move failed."""
         self.images_dir.mkdir(parents=True, exist_ok=True)
-        safe_name = f"{target_name}.png"
-        dest = self.images_dir / safe_name
-        counter = 1
-        while dest.exists():
-            dest = self.images_dir / f"{target_name} {counter}.png"
-            counter += 1
+        images_str = str(self.images_dir)
+        # one directory scan instead of a stat() per candidate name;
+        # normcase keeps the lookup case-insensitive on Windows like exists() was
+        with os.scandir(images_str) as it:
+            existing: Set[str] = {os.path.normcase(entry.name) for entry in it}
+        # candidates stay plain strings; only the chosen one becomes a Path
+        base = os.path.normcase(target_name)
+        chosen = f"{target_name}.png"
+        if f"{base}.png" in existing:
+            counter = 1
+            while f"{base} {counter}.png" in existing:
+                counter += 1
+            chosen = f"{target_name} {counter}.png"
+        dest = Path(os.path.join(images_str, chosen))
         try:
-            downloaded_path.rename(dest)
+            os.replace(downloaded_path, dest)
             console.print(
                 f"[green]Arquivo '{downloaded_path.name}' movido e renomeado para '{dest}'[/green]"
             )
-            return True
+            return dest
         except Exception as exc:
             console.print(f"[red]Erro ao mover '{downloaded_path}': {exc}[/red]")
-            return False
+            return None
 
     # ---- main flow ----
     def run(self) -> None:
         """Run the main flow: copy prompts, wait for downloads, rename, then copy file paths."""
         try:
-            original_snapshot: Set[str] = set(os.listdir(self.downloads_dir))
+            original_snapshot: Set[str] = self._snapshot_downloads()
             self.start_downloads_watcher()
 
             names: List[str] = self.read_names()
+            # final path of every image moved in this run, so the second pass
+            # doesn't have to rediscover it in images_dir
+            produced: Dict[str, str] = {}
             self.console_rule("Iniciando cópia de prompts")
 
             for index, name in enumerate(names):
                 count_display = f"{index + 1}/{len(names)}"
                 prompt = f"Create a '{name}' logo"
 
-                pyperclip.copy(prompt)
+                self._set_clipboard(prompt)
                 console.print(
                     f'\n{count_display}: Prompt "{prompt}" copiado. (Ctrl+R para pular)'
                 )
                 proceeded: bool = self._wait_for_user_paste_or_skip(prompt)
 
                 if not proceeded:
-                    console.print("[yellow]Prompt pulado pelo usuário.[/yellow]")
+                    console.print(_PROMPT_SKIPPED_MSG)
                     continue
 
-                console.print(
-                    "Aguardando arquivo ser baixado (pressione Ctrl+Shift+C para continuar sem download)\n"
-                )
+                console.print(_WAITING_DOWNLOAD_MSG)
                 new_png = self._wait_for_new_png_download(
                     original_snapshot, timeout=None
                 )
 
                 if new_png is None:
-                    console.print(
-                        "[yellow]Nenhum arquivo novo encontrado. Pulando renomeação.[/yellow]"
-                    )
-                    original_snapshot = set(os.listdir(self.downloads_dir))
+                    console.print(_NO_NEW_FILE_MSG)
+                    # a late download must not be taken for the next name
+                    original_snapshot = self._snapshot_downloads()
                     continue
 
-                moved_ok: bool = self.move_and_rename_file(new_png, name)
-                original_snapshot = set(os.listdir(self.downloads_dir))
-
-                if not moved_ok:
-                    console.print(f"[red]Falha ao mover '{new_png.name}'[/red]")
-                    continue
+                # buffer the move report, toast and rule into a single write
+                with console:
+                    dest = self.move_and_rename_file(new_png, name)
+                    # one scan per name: any other .png that arrived during this
+                    # step (or the file itself, if the move failed) must not be
+                    # handed to the next name
+                    original_snapshot = self._snapshot_downloads()
+                    if dest is None:
+                        console.print(f"[red]Falha ao mover '{new_png.name}'[/red]")
+                        continue
+                    produced.setdefault(name, str(dest))
 
-                if index + 1 == len(names):
-                    self._toaster.show_toast("PFP", "Última página copiada")  # type: ignore
+                    if index + 1 == len(names):
+                        self._show_toast("PFP", "Última página copiada")
 
-                console.rule()
+                    console.rule()
 
             # Copy image paths step
             self.console_rule("Copiar caminhos das imagens")
+            images: Optional[Dict[str, str]] = None
             for index, name in enumerate(names):
-                page_path = self.images_dir / f"{name}.png"
-                if not page_path.exists():
-                    matches = list(self.images_dir.glob(f"{name}*.png"))
-                    if matches:
-                        page_path = matches[0]
-                    else:
+                page_str = produced.get(name)
+                if page_str is None:
+                    # not moved in this run (skipped); fall back to what's on disk
+                    if images is None:
+                        images = self._index_images()
+                    key = os.path.normcase(name)
+                    page_str = images.get(key)
+                    if page_str is None:
+                        # same fallback the "{name}*.png" glob gave: first prefix match
+                        page_str = next(
+                            (p for stem, p in images.items() if stem.startswith(key)),
+                            None,
+                        )
+                    if page_str is None:
                         console.print(
                             f"[red]Arquivo para '{name}' não encontrado em {self.images_dir}[/red]"
                         )
                         continue
 
-                pyperclip.copy(str(page_path))
-                self._expected_clipboard_text = str(page_path)
+                self._set_clipboard(page_str)
+                self._expected_clipboard_text = page_str
                 console.print(
-                    f"\n{index + 1}/{len(names)}: Caminho '{page_path}' copiado (Ctrl+V para confirmar, Ctrl+R para pular)."
+                    f"\n{index + 1}/{len(names)}: Caminho '{page_str}' copiado (Ctrl+V para confirmar, Ctrl+R para pular)."
                 )
-                proceeded_path: bool = self._wait_for_user_paste_or_skip(str(page_path))
-                if not proceeded_path:
-                    console.print("[yellow]Caminho pulado pelo usuário.[/yellow]")
-                time.sleep(0.15)
+                proceeded_path: bool = self._wait_for_user_paste_or_skip(page_str)
+                if proceeded_path:
+                    # let the target app finish reading the clipboard before it changes
+                    time.sleep(0.15)
 
-                console.rule()
+                with console:
+                    if not proceeded_path:
+                        console.print(_PATH_SKIPPED_MSG)
+                    console.rule()
 
-            console.print("\n[green]Processo finalizado.[/green]")
+            console.print(_FINISHED_MSG)
 
         finally:
             self.stop_downloads_watcher()
 
+    @staticmethod
+    def _show_toast(title: str, message: str) -> None:
+        """Beep (on Windows) and print a highlighted notice in the console."""
+        if sys.platform == "win32":
+            ctypes.windll.user32.MessageBeep(0)  # type: ignore
+        console.print(f"[bold reverse] {title} [/bold reverse] {message}")
+
     @staticmethod
     def console_rule(title: str) -> None:
         console.rule(f"[bold]{title}[/bold]")
@@ -344,6 +704,9 @@ def ask_or_browse_for_directory(
     """Ask user for directory path or open the native folder browser when they press Enter.
     If path doesn't exist, ask to create it using a yes/no dialog.
     """
+    import tkinter as tk
+    from tkinter import filedialog, messagebox
+
     root = tk.Tk()
     root.withdraw()  # hide main window
 